@@ -1,97 +1,162 @@
+import os
+import sys
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+# des_core.py ada di root repo (satu level di atas folder ini)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from des_core import des_grid
+
 
 # ===============================
-# LOAD DATA (AUTO-DETECT COLUMN)
+# DES + METRIK (CACHED)
 # ===============================
 @st.cache_data
-def load_data():
+def _des_grid_cached(y, n_forecast=5):
+    # grid rapat alpha (step slider = 0.01) dihitung sekali per dataset
+    alphas = np.round(np.arange(0.10, 0.901, 0.01), 2)
+    metrics, forecasts, future = des_grid(y, alphas, n_forecast)
+    return alphas, metrics, forecasts, future
+
+
+@st.cache_data
+def _run_des(alpha, y, n_forecast=5):
+    alphas, metrics, forecasts, future = _des_grid_cached(y, n_forecast)
+
+    idx = np.searchsorted(alphas, round(alpha, 2))
+    idx = min(idx, alphas.size - 1)
+
+    mae, mse, rmse, mape = metrics[idx]
+
+    return {
+        "forecast": forecasts[idx],
+        "mae": mae,
+        "mse": mse,
+        "rmse": rmse,
+        "mape": mape,
+        "future_forecast": future[idx],
+    }
+
+
+# ===============================
+# FIGURE (CACHED)
+# ===============================
+@st.cache_resource
+def _make_fig(tahun, y, forecast, future_years, future_forecast):
+    # cache figure per isi data; rerun tidak alokasi ulang artist Matplotlib.
+    # Figure langsung (bukan plt.subplots) agar tidak menumpuk di
+    # registry global pyplot
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.plot(tahun, y, marker="o", label="Actual")
+    ax.plot(
+        np.concatenate([tahun, future_years]),
+        np.concatenate([forecast, future_forecast]),
+        linestyle="--",
+        marker="x",
+        label="Forecast DES"
+    )
+
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Gini Dispersion")
+    ax.legend()
+    ax.grid(True)
+
+    return fig
+
+
+# ===============================
+# LOAD DATA (AUTO-DETECT COLUMN)
+# ===============================
+def _load_or_cache(csv_path, parquet_path):
+    # cache Parquet di samping CSV (kunci: mtime sumber)
+    # supaya cold start tidak parse ulang teks CSV
+    if (os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)):
+        df = pd.read_parquet(
+            parquet_path, engine="pyarrow", dtype_backend="pyarrow"
+        )
+        # cache yang ditulis sebelum decimal="," menyimpan angka berkoma
+        # sebagai string; anggap basi dan parse ulang CSV-nya
+        if not any("string" in str(t) for t in df.dtypes):
+            return df
+
+    # dtype_backend pyarrow: satu kali parse C-level langsung ke kolom
+    # bertipe Arrow, tanpa perlu pd.to_numeric lagi.
+    # CSV ini memakai koma desimal ("59,1"), jadi decimal="," wajib
+    # supaya kolomnya terparse numerik, bukan string
     df = pd.read_csv(
-        "Income Inequality in South Africa_Dataset.csv",
+        csv_path,
         sep=";",
         encoding="latin1",
-        engine="python"
+        engine="c",
+        decimal=",",
+        dtype_backend="pyarrow"
+    )
+    df.to_parquet(parquet_path, engine="pyarrow", compression="zstd")
+    return df
+
+
+@st.cache_data
+def _load_arrays():
+    # hanya dua kolom numerik yang dipakai; langsung jadi ndarray
+    # tanpa membangun DataFrame hasil rename/dropna/sort_values
+    df = _load_or_cache(
+        "Income Inequality in South Africa_Dataset.csv",
+        "Income Inequality in South Africa_Dataset.parquet"
     )
 
     # normalisasi nama kolom
     df.columns = df.columns.str.strip().str.lower()
 
-    # deteksi kolom tahun
-    year_col = None
-    for c in df.columns:
-        if "year" in c or "tahun" in c or "time" in c:
-            year_col = c
-            break
-
-    # deteksi kolom gini
-    gini_col = None
-    for c in df.columns:
-        if "gini" in c:
-            gini_col = c
-            break
-
-    if year_col is None or gini_col is None:
+    # deteksi kolom tahun & gini (satu pass vektor atas Index)
+    cols = df.columns
+    year_mask = cols.str.contains(r"year|tahun|time", regex=True)
+    gini_mask = cols.str.contains("gini")
+
+    if not year_mask.any() or not gini_mask.any():
         st.error("Kolom tahun atau gini tidak ditemukan di CSV")
         st.stop()
 
-    # rename agar konsisten
-    df = df.rename(columns={
-        year_col: "year",
-        gini_col: "gini_disp"
-    })
+    year_col = cols[year_mask][0]
+    gini_col = cols[gini_mask][0]
 
-    # pastikan numerik
-    df["year"] = pd.to_numeric(df["year"], errors="coerce")
-    df["gini_disp"] = pd.to_numeric(df["gini_disp"], errors="coerce")
+    # kolom sudah bertipe (Arrow-backed); NA jadi NaN saat ke ndarray.
+    # float32 cukup untuk rentang nilai gini (setengah bandwidth di kernel)
+    tahun = df[year_col].to_numpy(np.float64, na_value=np.nan)
+    y = df[gini_col].to_numpy(np.float32, na_value=np.nan)
 
-    # bersihkan data
-    df = df.dropna(subset=["year", "gini_disp"])
-    df = df.sort_values("year")
+    # bersihkan data + urutkan berdasarkan tahun
+    valid = ~(np.isnan(tahun) | np.isnan(y))
+    tahun = tahun[valid]
+    y = y[valid]
 
-    return df
+    order = tahun.argsort()
+    return tahun[order], y[order]
 
 
 # ===============================
 # MODELING PAGE (DES)
 # ===============================
-def modeling_page(df):
+def modeling_page(tahun, y):
     st.title("📊 Modeling: Double Exponential Smoothing (DES)")
 
     alpha = st.slider("Nilai Alpha (α)", 0.1, 0.9, 0.8)
 
     if st.button("🔍 Jalankan Modeling"):
-        tahun = df["year"].values
-        y = df["gini_disp"].values
-
-        # DES Brown
-        S1 = [y[0]]
-        S2 = [y[0]]
-
-        for t in range(1, len(y)):
-            S1.append(alpha * y[t] + (1 - alpha) * S1[t-1])
-            S2.append(alpha * S1[t] + (1 - alpha) * S2[t-1])
-
-        a = [2*S1[i] - S2[i] for i in range(len(y))]
-        b = [(alpha/(1-alpha)) * (S1[i] - S2[i]) for i in range(len(y))]
+        # DES Brown + evaluasi (cached)
+        n_forecast = 5
+        res = _run_des(alpha, y, n_forecast)
 
-        forecast = [np.nan]
-        for i in range(1, len(y)):
-            forecast.append(a[i-1] + b[i-1])
-
-        # evaluasi
-        actual = y[1:]
-        pred = np.array(forecast[1:])
-
-        mae = np.mean(np.abs(actual - pred))
-        mse = np.mean((actual - pred)**2)
-        rmse = np.sqrt(mse)
-        mape = np.mean(np.abs((actual - pred) / actual)) * 100
+        forecast = res["forecast"]
+        future_forecast = res["future_forecast"]
 
         # forecast 5 tahun
-        future_years = np.arange(tahun[-1] + 1, tahun[-1] + 6)
-        future_forecast = [a[-1] + b[-1]*m for m in range(1, 6)]
+        future_years = np.arange(tahun[-1] + 1, tahun[-1] + 1 + n_forecast)
 
         df_future = pd.DataFrame({
             "Year": future_years,
@@ -100,30 +165,16 @@ def modeling_page(df):
 
         # OUTPUT
         st.subheader("📈 Evaluasi Model")
-        st.write(f"MAE  : {mae:.4f}")
-        st.write(f"MSE  : {mse:.4f}")
-        st.write(f"RMSE : {rmse:.4f}")
-        st.write(f"MAPE : {mape:.2f}%")
+        st.write(f"MAE  : {res['mae']:.4f}")
+        st.write(f"MSE  : {res['mse']:.4f}")
+        st.write(f"RMSE : {res['rmse']:.4f}")
+        st.write(f"MAPE : {res['mape']:.2f}%")
 
         st.subheader("🔮 Forecast 5 Tahun ke Depan")
         st.dataframe(df_future)
 
         # plot
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.plot(tahun, y, marker="o", label="Actual")
-        ax.plot(
-            list(tahun) + list(future_years),
-            list(forecast) + list(future_forecast),
-            linestyle="--",
-            marker="x",
-            label="Forecast DES"
-        )
-
-        ax.set_xlabel("Year")
-        ax.set_ylabel("Gini Dispersion")
-        ax.legend()
-        ax.grid(True)
-
+        fig = _make_fig(tahun, y, forecast, future_years, future_forecast)
         st.pyplot(fig)
         st.success("Modeling berhasil dijalankan ✅")
 
@@ -134,8 +185,8 @@ def modeling_page(df):
 def main():
     st.sidebar.title("Menu")
     st.sidebar.info("Tahap Modeling (DES)")
-    df = load_data()
-    modeling_page(df)
+    tahun, y = _load_arrays()
+    modeling_page(tahun, y)
 
 
 if __name__ == "__main__":
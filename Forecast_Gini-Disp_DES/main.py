@@ -1052,8 +1052,8 @@ elif menu == "🤖 Modeling":
         
         # Prediksi
         # surya, modeling grafik dan forecast periode tertentu
-        future_years = [years[-1] + k + 1 for k in range(periods_ahead)]
-        future_forecasts = [a[-1] + b[-1] * m for m in range(1, periods_ahead + 1)]
+        future_years = years[-1] + np.arange(1, periods_ahead + 1)
+        future_forecasts = a[-1] + b[-1] * np.arange(1, periods_ahead + 1)
         
         st.markdown(f"#### 🔮 Prediksi {periods_ahead} Tahun ke Depan")
         pred_df = pd.DataFrame({
@@ -1241,8 +1241,8 @@ elif menu == "✅ Evaluation":
         # Visualization
         st.subheader("📈 Visualisasi: Aktual vs Forecast")
         
-        future_years = [years[-1] + k + 1 for k in range(periods_ahead)]
-        future_forecasts = [a[-1] + b[-1] * m for m in range(1, periods_ahead + 1)]
+        future_years = years[-1] + np.arange(1, periods_ahead + 1)
+        future_forecasts = a[-1] + b[-1] * np.arange(1, periods_ahead + 1)
         
         fig, ax = plt.subplots(figsize=(12, 6))
         ax.plot(years, Y, marker='o', label='Actual GINI', color='#00E396', linewidth=2, markersize=6)
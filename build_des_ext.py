@@ -0,0 +1,74 @@
+# =====================================
+# BUILD EKSTENSI AOT DES (des_ext)
+# =====================================
+# Jalankan sekali: python build_des_ext.py
+# Menghasilkan des_ext.*.so di root repo. des_core.py otomatis
+# memakainya kalau ada (tanpa latensi JIT di first call); kalau tidak,
+# fallback ke @njit seperti biasa.
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC("des_ext")
+
+
+@cc.export("des_brown", "f4[:, :](f4[:], f8)")
+def des_brown(y, alpha):
+    # baris: S1, S2, a, b, forecast (pycc tidak bisa return tuple array)
+    n = y.shape[0]
+    out = np.empty((5, n), dtype=np.float32)
+    S1 = out[0]
+    S2 = out[1]
+
+    S1[0] = y[0]
+    S2[0] = y[0]
+
+    for t in range(1, n):
+        S1[t] = alpha * y[t] + (1 - alpha) * S1[t - 1]
+        S2[t] = alpha * S1[t] + (1 - alpha) * S2[t - 1]
+
+    for i in range(n):
+        out[2, i] = 2 * S1[i] - S2[i]
+        out[3, i] = (alpha / (1 - alpha)) * (S1[i] - S2[i])
+
+    out[4, 0] = np.nan
+    for i in range(1, n):
+        out[4, i] = out[2, i - 1] + out[3, i - 1]
+
+    return out
+
+
+@cc.export("des_metrics", "f8[:](f4[:], f4[:])")
+def des_metrics(actual, pred):
+    # urutan: MAE, MSE, RMSE, MAPE (satu pass, guard actual == 0;
+    # akumulator float64 demi stabilitas sum-of-squares)
+    n = actual.size
+    sa = 0.0
+    ss = 0.0
+    sr = 0.0
+    cnt = 0
+    for i in range(n):
+        d = actual[i] - pred[i]
+        sa += abs(d)
+        ss += d * d
+        if actual[i] != 0.0:
+            sr += abs(d) / abs(actual[i])
+            cnt += 1
+    out = np.empty(4)
+    out[0] = sa / n
+    out[1] = ss / n
+    out[2] = np.sqrt(ss / n)
+    out[3] = sr / cnt * 100 if cnt > 0 else np.nan
+    return out
+
+
+@cc.export("des_forecast", "f8[:](f8, f8, i8)")
+def des_forecast(a_last, b_last, horizon):
+    out = np.empty(horizon)
+    for m in range(horizon):
+        out[m] = a_last + b_last * (m + 1)
+    return out
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,159 @@
+# =====================================
+# KERNEL NUMERIK DES BROWN (SHARED)
+# =====================================
+# Dipakai bersama oleh modeling1/deploy1.py dan DEPLOY_UAS/deploy2.py
+# supaya kedua app tidak memelihara dua salinan kernel yang sama.
+# Semua @njit memakai cache=True sehingga kompilasi pertama tersimpan
+# di disk dan dipakai ulang oleh setiap proses/rerun Streamlit.
+#
+# Kalau ekstensi AOT des_ext.*.so tersedia (hasil build_des_ext.py),
+# semua API publik memakainya: plain C extension, tanpa latensi JIT di
+# first call. des_grid dalam mode AOT berupa loop serial Python atas
+# kernel C per alpha (grid cuma ~81 titik, dihitung sekali per dataset,
+# jadi overhead loop-nya tidak berarti); tanpa des_ext, des_grid jatuh
+# ke versi @njit(parallel=True).
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # fallback tanpa Numba: fungsi jalan sebagai Python biasa,
+    # array tetap dipreallokasi (tanpa list.append / boxing float)
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _des_brown_jit(y, alpha):
+    # rekursi DES Brown: S1/S2 di loop terkompilasi,
+    # a/b/forecast sebagai operasi vektor
+    n = len(y)
+    S1 = np.empty_like(y)
+    S2 = np.empty_like(y)
+
+    S1[0] = y[0]
+    S2[0] = y[0]
+
+    for t in range(1, n):
+        S1[t] = alpha * y[t] + (1 - alpha) * S1[t - 1]
+        S2[t] = alpha * S1[t] + (1 - alpha) * S2[t - 1]
+
+    a = 2 * S1 - S2
+    b = (alpha / (1 - alpha)) * (S1 - S2)
+
+    forecast = np.empty_like(y)
+    forecast[0] = np.nan
+    forecast[1:] = a[:-1] + b[:-1]
+
+    return S1, S2, a, b, forecast
+
+
+@njit(cache=True, fastmath=True)
+def _des_metrics_jit(actual, pred):
+    # MAE, MSE, RMSE, MAPE dalam satu pass (tanpa array temporer).
+    # Titik dengan actual == 0 dilewati pada MAPE supaya tidak
+    # menghasilkan inf diam-diam. Akumulator sengaja float64 walau
+    # input float32, demi stabilitas sum-of-squares.
+    n = actual.size
+    sa = 0.0
+    ss = 0.0
+    sr = 0.0
+    cnt = 0
+    for i in range(n):
+        d = actual[i] - pred[i]
+        sa += abs(d)
+        ss += d * d
+        if actual[i] != 0.0:
+            sr += abs(d) / abs(actual[i])
+            cnt += 1
+    mae = sa / n
+    mse = ss / n
+    rmse = np.sqrt(mse)
+    mape = sr / cnt * 100 if cnt > 0 else np.nan
+    return mae, mse, rmse, mape
+
+
+@njit(cache=True, fastmath=True)
+def _des_forecast_jit(a_last, b_last, horizon):
+    # forecast m periode ke depan: F(t+m) = a + b*m
+    out = np.empty(horizon)
+    for m in range(horizon):
+        out[m] = a_last + b_last * (m + 1)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _des_grid_jit(y, alphas, n_forecast):
+    # evaluasi DES + metrik untuk seluruh grid alpha (paralel per alpha);
+    # trajectory mengikuti dtype y (float32 dari loader), metrik tetap f8
+    k_total = alphas.size
+    metrics = np.empty((k_total, 4))
+    forecasts = np.empty((k_total, y.size), dtype=y.dtype)
+    future = np.empty((k_total, n_forecast))
+
+    for k in prange(k_total):
+        S1, S2, a, b, forecast = _des_brown_jit(y, alphas[k])
+        mae, mse, rmse, mape = _des_metrics_jit(y[1:], forecast[1:])
+
+        metrics[k, 0] = mae
+        metrics[k, 1] = mse
+        metrics[k, 2] = rmse
+        metrics[k, 3] = mape
+        forecasts[k] = forecast
+        future[k] = _des_forecast_jit(a[-1], b[-1], n_forecast)
+
+    return metrics, forecasts, future
+
+
+try:
+    import des_ext  # ekstensi AOT, lihat build_des_ext.py
+
+    # Kernel pycc dikompilasi untuk signature f4[:] tetap dan TIDAK
+    # mengecek tipe argumen: input float64 bikin proses segfault. Wrapper
+    # di bawah memaksa float32 kontigu dulu supaya binding AOT menerima
+    # input yang sama dengan binding @njit.
+
+    def des_brown(y, alpha):
+        y = np.ascontiguousarray(y, dtype=np.float32)
+        out = des_ext.des_brown(y, alpha)
+        return out[0], out[1], out[2], out[3], out[4]
+
+    def des_metrics(actual, pred):
+        actual = np.ascontiguousarray(actual, dtype=np.float32)
+        pred = np.ascontiguousarray(pred, dtype=np.float32)
+        m = des_ext.des_metrics(actual, pred)
+        return m[0], m[1], m[2], m[3]
+
+    def des_forecast(a_last, b_last, horizon):
+        return des_ext.des_forecast(float(a_last), float(b_last),
+                                    int(horizon))
+
+    def des_grid(y, alphas, n_forecast):
+        # loop serial atas grid lewat kernel AOT: per alpha satu panggilan
+        # C untuk rekursi + metrik, tanpa kompilasi JIT sama sekali
+        y = np.ascontiguousarray(y, dtype=np.float32)
+        k_total = alphas.size
+        metrics = np.empty((k_total, 4))
+        forecasts = np.empty((k_total, y.size), dtype=y.dtype)
+        future = np.empty((k_total, n_forecast))
+
+        for k in range(k_total):
+            out = des_ext.des_brown(y, alphas[k])
+            metrics[k] = des_ext.des_metrics(y[1:], out[4, 1:])
+            forecasts[k] = out[4]
+            future[k] = des_ext.des_forecast(float(out[2, -1]),
+                                             float(out[3, -1]),
+                                             int(n_forecast))
+
+        return metrics, forecasts, future
+
+except ImportError:
+    des_brown = _des_brown_jit
+    des_metrics = _des_metrics_jit
+    des_forecast = _des_forecast_jit
+    des_grid = _des_grid_jit